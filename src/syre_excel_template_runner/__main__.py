@@ -1,7 +1,4 @@
 import argparse
-from .types import DataFormatType, HeaderAction, ExcelDataArgs, SpreadsheetDataArgs
-from . import utils
-from . import excel_template_runner
 
 parser = argparse.ArgumentParser(
     prog="Syre Excel Template Runner",
@@ -104,66 +101,80 @@ parser.add_argument(
     help="Asset metadata for the output data. Nested metadata is incdicated using dot (.) notation.",
 )
 
-# parse
-args = parser.parse_args()
-if args.replace_start < 0:
-    raise ValueError("`--replace-start` must be non-negative.")
 
-if args.replace_end < 0:
-    raise ValueError("`--replace-end` must be non-negative.")
-
-replace_range = (args.replace_start, args.replace_end)
-
-data_format_type = utils.parse_data_format_type_arg(args.data_format_type)
-if data_format_type is DataFormatType.SPREADSHEET:
-    data_format_args = SpreadsheetDataArgs(
-        skip_rows=args.skip_rows, comment=args.comment_character
-    )
-elif data_format_type is DataFormatType.EXCEL_WORKBOOK:
-    if args.excel_sheet is None:
-        parser.error("--excel-sheet is required if --data-format-type=excel")
-    try:
-        excel_sheet = int(args.excel_sheet)
-    except:
-        excel_sheet = args.excel_sheet
-
-    data_format_args = ExcelDataArgs(sheet=excel_sheet, skip_rows=args.skip_rows)
-else:
-    parser.error(
-        "Could not parse value of `--data-format-type` into a data format type."
+def main():
+    # parse
+    args = parser.parse_args()
+    if args.replace_start < 0:
+        raise ValueError("`--replace-start` must be non-negative.")
+
+    if args.replace_end < 0:
+        raise ValueError("`--replace-end` must be non-negative.")
+
+    replace_range = (args.replace_start, args.replace_end)
+
+    # NB: Import heavy dependencies only once arguments are valid,
+    # so `--help` and argument errors return quickly.
+    from .types import DataFormatType, ExcelDataArgs, SpreadsheetDataArgs
+    from . import utils
+    from . import excel_template_runner
+
+    data_format_type = utils.parse_data_format_type_arg(args.data_format_type)
+    if data_format_type is DataFormatType.SPREADSHEET:
+        data_format_args = SpreadsheetDataArgs(
+            skip_rows=args.skip_rows, comment=args.comment_character
+        )
+    elif data_format_type is DataFormatType.EXCEL_WORKBOOK:
+        if args.excel_sheet is None:
+            parser.error("--excel-sheet is required if --data-format-type=excel")
+        try:
+            excel_sheet = int(args.excel_sheet)
+        except:
+            excel_sheet = args.excel_sheet
+
+        data_format_args = ExcelDataArgs(sheet=excel_sheet, skip_rows=args.skip_rows)
+    else:
+        parser.error(
+            "Could not parse value of `--data-format-type` into a data format type."
+        )
+
+    data_columns = utils.parse_column_selection_args(args.data_columns)
+    header_action = utils.parse_header_action(args.header_action)
+    asset_filter = {
+        "name": args.filter_name,
+        "type": args.filter_type,
+        "tags": args.filter_tags,
+    }
+
+    if args.filter_metadata is not None:
+        metadata = utils.parse_metadata_args(args.filter_metadata)
+        asset_filter["metadata"] = metadata
+
+    output_properties = {
+        "name": args.output_name,
+        "type": args.output_type,
+        "tags": args.output_tags,
+    }
+
+    if args.output_metadata is not None:
+        metadata = utils.parse_metadata_args(args.output_metadata)
+        output_properties["metadata"] = metadata
+
+    excel_template_runner.main(
+        args.template,
+        args.worksheet,
+        replace_range,
+        data_format_type,
+        data_columns,
+        header_action,
+        args.output,
+        data_format_args=data_format_args,
+        asset_filter=asset_filter,
+        output_properties=output_properties,
     )
 
-data_columns = utils.parse_column_selection_args(args.data_columns)
-header_action = utils.parse_header_action(args.header_action)
-asset_filter = {
-    "name": args.filter_name,
-    "type": args.filter_type,
-    "tags": args.filter_tags,
-}
-
-if args.filter_metadata is not None:
-    metadata = utils.parse_metadata_args(args.filter_metadata)
-    asset_filter["metadata"] = metadata
-
-output_properties = {
-    "name": args.output_name,
-    "type": args.output_type,
-    "tags": args.output_tags,
-}
-
-if args.output_metadata is not None:
-    metadata = utils.parse_metadata_args(args.output_metadata)
-    output_properties["metadata"] = metadata
-
-excel_template_runner.main(
-    args.template,
-    args.worksheet,
-    replace_range,
-    data_format_type,
-    data_columns,
-    header_action,
-    args.output,
-    data_format_args=data_format_args,
-    asset_filter=asset_filter,
-    output_properties=output_properties,
-)
+
+# NB: Guard the entry point so worker processes spawned to read assets
+# do not run it when importing this module.
+if __name__ == "__main__":
+    main()
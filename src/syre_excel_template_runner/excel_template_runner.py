@@ -1,5 +1,10 @@
-from typing import Optional
+from typing import Optional, BinaryIO, Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+import csv
+import io
 import os
+import re
 
 import pandas
 import openpyxl as xl
@@ -10,6 +15,45 @@ from openpyxl.formula.translate import Translator
 import formulas
 import syre
 
+try:
+    from pyarrow import ArrowInvalid
+    from pyarrow import csv as pa_csv
+    from pyarrow import types as pa_types
+except ImportError:
+    pa_csv = None
+    pa_types = None
+
+# NB: Default missing value strings of `pandas.read_csv`,
+# so `pyarrow` reads the same values as missing.
+_PANDAS_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+# NB: Input workbooks are only read, so the Rust backed `wolfxl` can be used if installed.
+# The template relies on `openpyxl` internals and is always loaded with `openpyxl`.
+try:
+    from wolfxl import load_workbook as load_data_workbook
+except ImportError:
+    from openpyxl import load_workbook as load_data_workbook
+
 from . import utils
 from .types import (
     DataFormatType,
@@ -22,9 +66,455 @@ from .types import (
     AssetFilter,
     AssetProperties,
     ReplaceRange,
+    DataColumn,
+    AssetData,
 )
 
 
+@lru_cache(maxsize=8192)
+def _translate_range_cached(range_str: str, rdelta: int, cdelta: int) -> str:
+    """Memoized `Translator.translate_range`.
+    Templates tend to reuse a small number of ranges, so most translations are repeated.
+    """
+    return Translator.translate_range(range_str, rdelta=rdelta, cdelta=cdelta)
+
+
+def calculate_uncached_formulas(
+    path: str,
+    sheet: str,
+    column_selection: ColumnSelection,
+    input_data: list,
+    buffer: Optional[BinaryIO] = None,
+):
+    """Calculates the value of formulas that do not have a cached value.
+    Workbooks that were not saved by Excel (e.g. created programatically)
+    may not contain cached formula values, in which case they are calculated using `formulas`.
+    The workbook is only probed for formulas if a value is missing,
+    and the formula engine is only used if an uncached formula is found.
+
+    Args:
+        path (str): Path to the workbook.
+        sheet (str): Title of the worksheet containing the data.
+        column_selection (ColumnSelection): List of column indices (0-based) the data was read from.
+        input_data (list[list]): Cached values of the selected columns.
+            Missing values are replaced in place.
+        buffer (Optional[BinaryIO], optional): Contents of the workbook, if already read.
+            Used instead of re-reading `path` to find formulas. Defaults to None.
+    """
+    max_col = utils.index_to_excel(max(column_selection))
+    max_row = max(
+        (
+            utils.index_to_excel(row_idx)
+            for input_column in input_data
+            for row_idx, value in enumerate(input_column)
+            if value is None
+        ),
+        default=0,
+    )
+    if max_row == 0:
+        return
+
+    if buffer is not None:
+        buffer.seek(0)
+
+    formula_wb = load_data_workbook(
+        path if buffer is None else buffer, read_only=True, keep_links=False
+    )
+    try:
+        uncached = []
+        rows = formula_wb[sheet].iter_rows(max_col=max_col, max_row=max_row)
+        for row_idx, row in enumerate(rows):
+            for input_column, idx in zip(input_data, column_selection):
+                if row[idx].data_type != "f":
+                    continue
+
+                if input_column[row_idx] is not None:
+                    # NB: Workbooks are saved with either all or none of their formula values cached,
+                    # so a single cached value means no calculation is needed.
+                    return
+
+                uncached.append((input_column, row_idx, idx))
+    finally:
+        formula_wb.close()
+
+    if len(uncached) == 0:
+        return
+
+    context_key = f"'[{os.path.basename(path)}]{sheet.upper()}'"
+    uncached_keys = [
+        f"{context_key}!{xl_utils.get_column_letter(utils.index_to_excel(idx))}"
+        f"{utils.index_to_excel(row_idx)}"
+        for _, row_idx, idx in uncached
+    ]
+
+    # NB: Only calculate the uncached cells and their dependencies.
+    xl_model = formulas.ExcelModel().loads(path).finish()
+    calculated_data = xl_model.calculate(outputs=uncached_keys)
+    for (input_column, row_idx, _), key in zip(uncached, uncached_keys):
+        calculated_cell = calculated_data.get(key)
+        if calculated_cell is not None:
+            input_column[row_idx] = calculated_cell.value[0, 0]
+
+
+def read_excel_data(
+    path: str,
+    data_worksheet: WorksheetId,
+    column_selection: ColumnSelection,
+    skip_rows: int = 0,
+) -> AssetData:
+    """Read the selected columns of an Excel workbook.
+
+    Args:
+        path (str): Path to the workbook.
+        data_worksheet (WorksheetId): Worksheet id containing the data.
+        column_selection (ColumnSelection): List of column indices (0-based) identifying the data to read.
+        skip_rows (int, optional): Number of rows to skip at the start of each column. Defaults to 0.
+
+    Raises:
+        NotImplementedError: If columns are selected by header.
+        TypeError: If `column_selection` or `data_worksheet` is invalid.
+
+    Returns:
+        AssetData: Selected columns.
+    """
+    selection_type = utils.selection_type(column_selection)
+    if selection_type is ColumnId.HEADER:
+        raise NotImplementedError()
+    elif selection_type is not ColumnId.INDEX:
+        raise TypeError("Invalid column selection")
+
+    if not isinstance(data_worksheet, (str, int)):
+        raise TypeError("Invalid `data_worksheet`")
+
+    # NB: `data_only` reads the values cached by Excel on last save,
+    # so formulas only need to be calculated if the cache is missing.
+    # NB: Read the file once so it can be shared if formulas need to be probed.
+    with open(path, "rb") as f:
+        buffer = io.BytesIO(f.read())
+
+    input_wb = load_data_workbook(
+        buffer, read_only=True, data_only=True, keep_links=False
+    )
+    try:
+        if isinstance(data_worksheet, str):
+            input_ws = input_wb[data_worksheet]
+        else:
+            input_ws = input_wb.worksheets[data_worksheet]
+
+        # NB: `iter_cols` is not available in read-only mode,
+        # so stream the rows once and bucket the selected columns.
+        # Rows are padded to `max_col`, and cells past it are never built.
+        max_col = utils.index_to_excel(max(column_selection))
+        input_data = [[] for _ in column_selection]
+        for row in input_ws.iter_rows(max_col=max_col, values_only=True):
+            for input_column, idx in zip(input_data, column_selection):
+                input_column.append(row[idx])
+
+        sheet_title = input_ws.title
+    finally:
+        input_wb.close()
+
+    calculate_uncached_formulas(
+        path, sheet_title, column_selection, input_data, buffer=buffer
+    )
+
+    return [DataColumn(values=input_column[skip_rows:]) for input_column in input_data]
+
+
+def _pandas_column_data(df: pandas.DataFrame) -> AssetData:
+    """Converts the columns of a DataFrame into column data.
+
+    Args:
+        df (pandas.DataFrame): Data.
+
+    Returns:
+        AssetData: Columns of `df`.
+    """
+    # NB: `tolist` converts the column to Python scalars in a single pass,
+    # avoiding boxing each value through `Series.__iter__`.
+    # Numeric NumPy columns (i.e. not nullable extension types) only contain `int` or `float` values.
+    return [
+        DataColumn(
+            values=col.tolist(),
+            header=col_label if isinstance(col_label, tuple) else (col_label,),
+            numeric=(
+                col.dtype.kind in "iuf"
+                and not pandas.api.types.is_extension_array_dtype(col.dtype)
+            ),
+        )
+        for col_label, col in df.items()
+    ]
+
+
+def _read_csv_header(path: str, skip_rows: int = 0) -> Optional[tuple]:
+    """Reads the header of a CSV file, labeling the columns as `pandas` does.
+    i.e. Empty labels are replaced with `Unnamed: <index>`
+    and duplicate labels are suffixed with `.<count>`.
+
+    Args:
+        path (str): Path to the CSV file.
+        skip_rows (int, optional): Number of rows to skip until the header. Defaults to 0.
+
+    Returns:
+        Optional[tuple[list[str], int]]: Column labels and the number of rows up to and including the header,
+            or `None` if the file does not have a header.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for _ in range(skip_rows):
+            f.readline()
+
+        # NB: Blank lines before the header are skipped, as by `pandas`.
+        rows = skip_rows
+        while True:
+            line = f.readline()
+            if line == "":
+                return None
+
+            rows += 1
+            if line.strip("\r\n") != "":
+                break
+
+    labels = next(csv.reader([line]))
+    labels = [
+        label if label != "" else f"Unnamed: {idx}" for idx, label in enumerate(labels)
+    ]
+
+    counts = {}
+    for idx, label in enumerate(labels):
+        count = counts.get(label, 0)
+        while count > 0:
+            counts[label] = count + 1
+            label = f"{label}.{count}"
+            count = counts.get(label, 0)
+
+        labels[idx] = label
+        counts[label] = count + 1
+
+    return labels, rows
+
+
+def _arrow_type_matches_pandas(col_type) -> bool:
+    """Checks whether `pandas` reads a column `pyarrow` infers as `col_type` as the same values.
+
+    Args:
+        col_type (pyarrow.DataType): Inferred type of the column.
+
+    Returns:
+        bool: `True` if the column is an integer, floating point, or boolean column.
+    """
+    return (
+        pa_types.is_integer(col_type)
+        or pa_types.is_floating(col_type)
+        or pa_types.is_boolean(col_type)
+    )
+
+
+def _arrow_column_data(label: str, col) -> Optional[DataColumn]:
+    """Converts an Arrow column into column data.
+
+    Args:
+        label (str): Column label.
+        col (pyarrow.ChunkedArray): Column.
+
+    Returns:
+        Optional[DataColumn]: Column data,
+            or `None` if the column's type may not match what `pandas` would read.
+    """
+    col_type = col.type
+    values = col.to_pylist()
+    if pa_types.is_integer(col_type) or pa_types.is_floating(col_type):
+        # NB: `pandas` reads numeric columns with missing values as floats, with missing values as `NaN`.
+        if col.null_count > 0:
+            nan = float("nan")
+            values = [nan if value is None else float(value) for value in values]
+
+        return DataColumn(values=values, header=(label,), numeric=True)
+    elif pa_types.is_boolean(col_type) and col.null_count == 0:
+        return DataColumn(values=values, header=(label,), numeric=False)
+
+    return None
+
+
+def read_csv_columns(
+    path: str,
+    usecols: ColumnSelection,
+    skip_rows: int = 0,
+    comment: Optional[str] = None,
+) -> AssetData:
+    """Reads the selected columns of a CSV file.
+    Uses `pyarrow`'s multi-threaded reader if it is installed,
+    otherwise, or if a comment character is given, falls back to `pandas`.
+    `pandas` is also used if `pyarrow` infers a column type that `pandas` may read differently
+    (e.g. strings, dates, or times).
+
+    Args:
+        path (str): Path to the CSV file.
+        usecols (list[int]): Sorted column indices (0-based) to read.
+        skip_rows (int, optional): Number of rows to skip until the header. Defaults to 0.
+        comment (Optional[str (length 1)], optional): Comment character to ignore lines. Defaults to None.
+
+    Returns:
+        AssetData: Selected columns, in file order.
+    """
+    if pa_csv is None or comment is not None:
+        return _read_csv_columns_pandas(path, usecols, skip_rows, comment)
+
+    header = _read_csv_header(path, skip_rows)
+    if header is None or max(usecols) >= len(header[0]):
+        return _read_csv_columns_pandas(path, usecols, skip_rows, comment)
+
+    # NB: Columns are selected by position, so unique labels are given to `pyarrow`.
+    labels, header_rows = header
+    read_options = pa_csv.ReadOptions(column_names=labels, skip_rows=header_rows)
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=[labels[idx] for idx in usecols],
+        null_values=_PANDAS_NA_VALUES,
+        strings_can_be_null=True,
+        true_values=["True", "TRUE", "true"],
+        false_values=["False", "FALSE", "false"],
+    )
+    try:
+        # NB: Check the types inferred from the first block before parsing the whole file,
+        # so selections that must be read by `pandas` are only parsed once.
+        with pa_csv.open_csv(
+            path, read_options=read_options, convert_options=convert_options
+        ) as reader:
+            schema = reader.schema
+
+        if not all(_arrow_type_matches_pandas(field.type) for field in schema):
+            return _read_csv_columns_pandas(path, usecols, skip_rows, comment)
+
+        table = pa_csv.read_csv(
+            path, read_options=read_options, convert_options=convert_options
+        )
+    except ArrowInvalid:
+        return _read_csv_columns_pandas(path, usecols, skip_rows, comment)
+
+    # NB: Convert the Arrow columns to Python lists directly
+    # instead of going through a DataFrame.
+    data = []
+    for label, col in zip(table.column_names, table.columns):
+        column = _arrow_column_data(label, col)
+        if column is None:
+            return _read_csv_columns_pandas(path, usecols, skip_rows, comment)
+
+        data.append(column)
+
+    return data
+
+
+def _read_csv_columns_pandas(
+    path: str,
+    usecols: ColumnSelection,
+    skip_rows: int = 0,
+    comment: Optional[str] = None,
+) -> AssetData:
+    """Reads the selected columns of a CSV file using `pandas`.
+
+    Args:
+        path (str): Path to the CSV file.
+        usecols (list[int]): Sorted column indices (0-based) to read.
+        skip_rows (int, optional): Number of rows to skip until the header. Defaults to 0.
+        comment (Optional[str (length 1)], optional): Comment character to ignore lines. Defaults to None.
+
+    Returns:
+        AssetData: Selected columns, in file order.
+    """
+    data = pandas.read_csv(path, skiprows=skip_rows, comment=comment, usecols=usecols)
+    return _pandas_column_data(data)
+
+
+def read_csv_data(
+    path: str,
+    columns_selection: ColumnSelection,
+    skip_rows: int = 0,
+    comment: Optional[str] = None,
+) -> AssetData:
+    """Read the selected columns of a CSV file.
+
+    Args:
+        path (str): Path to the CSV file.
+        column_selection (ColumnSelection): List of column indices (0-based) identifying the data to read.
+        skip_rows (int, optional): Number of rows to skip until the header. Defaults to 0.
+        comment (Optional[str (length 1)], optional): Comment character to ignore lines. Defaults to None.
+
+    Raises:
+        NotImplementedError: If columns are selected by header.
+        RuntimeError: If `column_selection` is invalid.
+
+    Returns:
+        AssetData: Selected columns.
+    """
+    data_selector_type = utils.selection_type(columns_selection)
+    if data_selector_type is ColumnId.INDEX:
+        if any(idx < 0 for idx in columns_selection):
+            # NB: `usecols` does not accept negative indices,
+            # so resolve them from the end of the header.
+            header = pandas.read_csv(path, skiprows=skip_rows, comment=comment, nrows=0)
+            width = len(header.columns)
+            columns_selection = [
+                idx + width if idx < 0 else idx for idx in columns_selection
+            ]
+
+        # NB: `usecols` prevents unselected columns from being parsed,
+        # but returns columns in file order, so reorder to match the selection.
+        usecols = sorted(set(columns_selection))
+        data = read_csv_columns(path, usecols, skip_rows=skip_rows, comment=comment)
+        return [data[usecols.index(idx)] for idx in columns_selection]
+    elif data_selector_type is ColumnId.HEADER:
+        raise NotImplementedError("todo")
+        # df = data.loc[:, data_selector]
+    else:
+        raise RuntimeError("Invalid data selector")
+
+
+def insert_data(
+    worksheet: Worksheet,
+    data: AssetData,
+    header_action: HeaderAction,
+    current_column: int,
+    asset_path: Optional[str] = None,
+):
+    """Insert data read from an asset into a worksheet.
+
+    Args:
+        worksheet (Worksheet): Template worksheet in which to insert the data.
+        data (AssetData): Data to insert.
+        header_action (HeaderAction): How to construct data headers. [template]
+        current_column (int): Current column index of the template manipulation.
+            Columns for the data must already be inserted into the template.
+        asset_path (str): Relative path to the asset file.
+            Used to label data if `data-label` is `HeaderAction.INSERT` or `HeaderAction.REPLACE`.
+            Defaults to None.
+    """
+    # NB: The header action is constant for all columns, so resolve it once.
+    write_asset_path = (
+        header_action is HeaderAction.INSERT or header_action is HeaderAction.REPLACE
+    )
+    write_data_header = header_action is not HeaderAction.REPLACE
+
+    current_column_excel = utils.index_to_excel(current_column)
+    for column, data_column in enumerate(data, start=current_column_excel):
+        data_row_start = 1
+        if write_asset_path:
+            data_row_start = utils.write_column(
+                worksheet, column, data_row_start, [asset_path]
+            )
+
+        if write_data_header:
+            data_row_start = utils.write_column(
+                worksheet, column, data_row_start, data_column.header
+            )
+
+        utils.write_column(
+            worksheet,
+            column,
+            data_row_start,
+            data_column.values,
+            numeric=data_column.numeric,
+        )
+
+
 def insert_data_from_excel(
     asset: syre.Asset,
     worksheet: Worksheet,
@@ -44,67 +534,19 @@ def insert_data_from_excel(
         column_selection (ColumnSelection): List of column headers or labels identifying the data to be copied into the template. [data]
         header_action (HeaderAction): How to label data. [template]
         current_column (int): Current column index of the template manipulation.
+            Columns for the data must already be inserted into the template.
         skip_rows (int, optional): Number of rows to skip until the first header or data. Defaults to 0.
         asset_path (str): Relative path to the asset file.
             Used to label data if `data-label` is `HeaderAction.INSERT` or `HeaderAction.REPLACE`.
             Defaults to None.
     """
-    asset_file_name = os.path.basename(asset.file)
-    xl_model = formulas.ExcelModel().loads(asset.file).finish()
-    calculated_data = xl_model.calculate()
-    input_wb = xl.load_workbook(asset.file)
-
-    if isinstance(data_worksheet, str):
-        input_ws = input_wb.get_sheet_by_name(data_worksheet)
-    elif isinstance(data_worksheet, int):
-        input_ws = input_wb.worksheets[data_worksheet]
-    else:
-        raise TypeError("Invalid `data_worksheet`")
-
-    current_column_excel = utils.index_to_excel(current_column)
-    context_key = f"'[{asset_file_name}]{input_ws.title.upper()}'"
-    worksheet.insert_cols(current_column_excel, len(column_selection))
-
-    selection_type = utils.selection_type(column_selection)
-    if selection_type is ColumnId.INDEX:
-        input_data = [
-            col
-            for idx, col in enumerate(input_ws.iter_cols())
-            if idx in column_selection
-        ]
-    elif selection_type is ColumnId.HEADER:
-        raise NotImplementedError()
-    else:
-        raise TypeError("Invalid column selection")
+    if header_action is not HeaderAction.REPLACE:
+        skip_rows = 0
 
-    for input_column in input_data:
-        data_row_start = 1
-        if (
-            header_action is HeaderAction.INSERT
-            or header_action is HeaderAction.REPLACE
-        ):
-            worksheet.cell(row=1, column=current_column_excel).value = asset_path
-            data_row_start += 1
-
-        if header_action is HeaderAction.REPLACE:
-            input_column = input_column[skip_rows:]
-
-        for row, input_cell in enumerate(input_column, start=data_row_start):
-            template_cell = worksheet.cell(row=row, column=current_column_excel)
-            if type(input_cell.value) is str:
-                tok = Tokenizer(input_cell.value)
-                tokens = tok.items
-                if len(tokens) == 0:
-                    continue
-                elif tokens[0].type == Token.LITERAL:
-                    template_cell.value = input_cell.value
-                else:
-                    calculated_cell = calculated_data.get(
-                        f"{context_key}!{input_cell.coordinate}"
-                    )
-                    template_cell.value = calculated_cell.value[0, 0]
-            else:
-                template_cell.value = input_cell.value
+    data = read_excel_data(
+        asset.file, data_worksheet, column_selection, skip_rows=skip_rows
+    )
+    insert_data(worksheet, data, header_action, current_column, asset_path=asset_path)
 
 
 def insert_data_from_csv(
@@ -125,49 +567,17 @@ def insert_data_from_csv(
         column_selection (ColumnSelection): List of column headers or labels identifying the data to be copied into the template. [data]
         header_action (HeaderAction): How to construct data headers. [template]
         current_column (int): Current column index of the template manipulation.
+            Columns for the data must already be inserted into the template.
         skip_rows (int, optional): Number of rows to skip until the first header or data. Defaults to 0.
         comment (Optional[str (length 1)], optional): Comment character to ignore lines. Defaults to None.
         asset_path (str): Relative path to the asset file.
             Used to label data if `data-label` is `HeaderAction.INSERT` or `HeaderAction.REPLACE`.
             Defaults to None.
     """
-    data = pandas.read_csv(asset.file, skiprows=skip_rows, comment=comment)
-    data_selector_type = utils.selection_type(columns_selection)
-    if data_selector_type is ColumnId.INDEX:
-        df = data.iloc[:, columns_selection]
-    elif data_selector_type is ColumnId.HEADER:
-        raise NotImplementedError("todo")
-        # df = data.loc[:, data_selector]
-    else:
-        raise RuntimeError("Invalid data selector")
-
-    current_column_excel = utils.index_to_excel(current_column)
-    worksheet.insert_cols(current_column_excel, len(columns_selection))
-    for col_label, col in df.items():
-        data_row_start = 1
-        if (
-            header_action is HeaderAction.INSERT
-            or header_action is HeaderAction.REPLACE
-        ):
-            worksheet.cell(row=data_row_start, column=current_column_excel).value = (
-                asset_path
-            )
-            data_row_start += 1
-
-        if header_action is not HeaderAction.REPLACE:
-            if type(col_label) is tuple:
-                for row, label in enumerate(col_label, start=data_row_start):
-                    worksheet.cell(row=row, column=current_column_excel).value = label
-
-                data_row_start += len(col_label)
-            else:
-                worksheet.cell(
-                    row=data_row_start, column=current_column_excel
-                ).value = col_label
-                data_row_start += 1
-
-        for row, value in enumerate(col, start=data_row_start):
-            worksheet.cell(row=row, column=current_column_excel, value=value)
+    data = read_csv_data(
+        asset.file, columns_selection, skip_rows=skip_rows, comment=comment
+    )
+    insert_data(worksheet, data, header_action, current_column, asset_path=asset_path)
 
 
 def translate_tokenizer_formula(
@@ -192,54 +602,84 @@ def translate_tokenizer_formula(
     """
     # NB: `column_shift` could be calculated from `replace-range` and `insertion_break_column`,
     # but is passed in for efficiency as this funciton may be called often and the column shift will be constant.
+    # NB: Attribute lookups are hoisted out of the token loop for the same reason.
+    operand_type = Token.OPERAND
+    range_subtype = Token.RANGE
+    translate = _translate_range_cached
+    range_boundaries = xl_utils.range_boundaries
+    excel_to_index = utils.excel_to_index
+    replace_start, replace_end = replace_range
+    insert_header = header_action is HeaderAction.INSERT
+
     for token in tokenizer.items:
-        if token.type == Token.OPERAND and token.subtype == Token.RANGE:
-            col_start, _, col_end, _ = xl_utils.range_boundaries(token.value)
-            col_start = utils.excel_to_index(col_start)
-            col_end = utils.excel_to_index(col_end)
-            if col_end == replace_range[1]:
-                # expand range to include new data
-                formula_range = token.value.split(":")
-                if len(formula_range) == 1:
-                    token.value = Translator.translate_range(
-                        formula_range[0], redelta=0, cdelta=column_shift
-                    )
-                elif len(formula_range) == 2:
-                    formula_range[1] = Translator.translate_range(
-                        formula_range[1], rdelta=0, cdelta=column_shift
-                    )
-                    token.value = ":".join(formula_range)
-                else:
-                    raise ValueError(f"Invalid range `{token.value}`")
-
-            if col_start > replace_range[1]:
-                token.value = Translator.translate_range(
-                    token.value, rdelta=0, cdelta=column_shift
-                )
-
-            if header_action is HeaderAction.INSERT:
-                formula_range = token.value.split(":")
-                if len(formula_range) == 1:
-                    if replace_range[0] <= col_start <= insertion_break_column:
-                        try:
-                            token.value = Translator.translate_range(
-                                formula_range[0], rdelta=1, cdelta=0
-                            )
-                        except ValueError:
-                            pass
-                elif len(formula_range) == 2:
-                    if (
-                        replace_range[0] <= col_start <= insertion_break_column
-                        and replace_range[0] <= col_end <= insertion_break_column
-                    ):
-                        try:
-                            token.value = Translator.translate_range(
-                                token.value, rdelta=1, cdelta=0
-                            )
-                        except ValueError:
-                            pass
-                else:
-                    raise ValueError(f"Invalid range `{token.value}`")
+        if token.type != operand_type or token.subtype != range_subtype:
+            continue
+
+        col_start, _, col_end, _ = range_boundaries(token.value)
+        col_start = excel_to_index(col_start)
+        col_end = excel_to_index(col_end)
+        if col_end == replace_end:
+            # expand range to include new data
+            formula_range = token.value.split(":")
+            if len(formula_range) == 1:
+                token.value = translate(formula_range[0], 0, column_shift)
+            elif len(formula_range) == 2:
+                formula_range[1] = translate(formula_range[1], 0, column_shift)
+                token.value = ":".join(formula_range)
+            else:
+                raise ValueError(f"Invalid range `{token.value}`")
+
+        if col_start > replace_end:
+            token.value = translate(token.value, 0, column_shift)
+
+        if insert_header:
+            formula_range = token.value.split(":")
+            if len(formula_range) == 1:
+                if replace_start <= col_start <= insertion_break_column:
+                    try:
+                        token.value = translate(formula_range[0], 1, 0)
+                    except ValueError:
+                        pass
+            elif len(formula_range) == 2:
+                if (
+                    replace_start <= col_start <= insertion_break_column
+                    and replace_start <= col_end <= insertion_break_column
+                ):
+                    try:
+                        token.value = translate(token.value, 1, 0)
+                    except ValueError:
+                        pass
+            else:
+                raise ValueError(f"Invalid range `{token.value}`")
+
+
+# NB: Matches runs of up to three letters that are not part of a longer word or a function call.
+# This includes the column of every cell (e.g. `$A$1`) and column (e.g. `A:C`) reference.
+_COLUMN_REFERENCE = re.compile(
+    r"(?<![A-Z0-9_.])\$?([A-Z]{1,3})(?![A-Z_(])", re.IGNORECASE
+)
+
+
+def _references_column_from(formula: str, min_column: int) -> bool:
+    """Checks whether a formula may reference a column at or after `min_column`.
+    May give false positives, but never false negatives.
+
+    Args:
+        formula (str): Formula.
+        min_column (int): Column index (Excel 1-based).
+
+    Returns:
+        bool: `True` if the formula may reference a column at or after `min_column`.
+    """
+    for letters in _COLUMN_REFERENCE.findall(formula):
+        try:
+            if xl_utils.column_index_from_string(letters) >= min_column:
+                return True
+        except ValueError:
+            # not a valid column, so can not be ruled out
+            return True
+
+    return False
 
 
 def translate_worksheet_formulas(
@@ -262,29 +702,84 @@ def translate_worksheet_formulas(
     if column_shift == 0 and header_action is not HeaderAction.INSERT:
         return
 
+    # Formulas can only require translation if they reference a column
+    # at or after the start of the replace range,
+    # so cheaply check the column references before tokenizing.
+    min_column = utils.index_to_excel(replace_range[0])
+
     for ws in workbook.worksheets:
-        for col, column in enumerate(ws.iter_cols(), start=1):
+        # NB: Scan the worksheet's cell store directly.
+        # `iter_cols` reorders the row-major store and creates cells for empty coordinates.
+        for (_, col), cell in ws._cells.items():
             if replace_range[0] <= col <= insertion_break_column:
                 # in replaced range or index
                 continue
 
-            for cell in column:
-                if type(cell.value) is not str:
-                    continue
+            # NB: `data_type` is already classified by openpyxl,
+            # so checking it avoids inspecting the value of non-formula cells.
+            if cell.data_type != "f":
+                continue
 
-                tok = Tokenizer(cell.value)
-                tokens = tok.items
-                if len(tokens) == 0 or tokens[0].type == Token.LITERAL:
-                    continue
+            value = cell.value
+            if not isinstance(value, str):
+                # array and data table formulas
+                continue
+
+            if not _references_column_from(value, min_column):
+                continue
+
+            tok = Tokenizer(value)
+            if len(tok.items) == 0:
+                continue
+
+            translate_tokenizer_formula(
+                tok,
+                replace_range,
+                column_shift,
+                header_action,
+                insertion_break_column,
+            )
+
+            formula = tok.render()
+            if formula == value:
+                continue
+
+            # NB: Set the formula directly, it does not need the `value` setter's type coercion.
+            cell._value = formula
+            cell.data_type = "f"
+
+
+# NB: Minimum total size of the asset files for them to be read in parallel.
+# Spawned worker processes take on the order of seconds to start
+# as each re-imports the dependencies, so small inputs are read serially.
+PARALLEL_READ_MIN_BYTES = 64 * 1024 * 1024
+
+
+def read_assets(
+    read_data: Callable[[str], AssetData], assets: "list[syre.Asset]"
+) -> Iterator[AssetData]:
+    """Read the data of each asset.
+    Parsing is independent for each asset, so if the assets are large enough
+    (see `PARALLEL_READ_MIN_BYTES`) they are read in parallel processes.
+    On platforms that spawn processes (e.g. Windows and macOS),
+    the calling script must guard its entry point with `if __name__ == "__main__":`.
+
+    Args:
+        read_data (Callable[[str], AssetData]): Function reading the data from an asset's file.
+            Must be picklable.
+        assets (list[syre.Asset]): Assets to read.
+
+    Yields:
+        AssetData: Data of each asset, in the order of `assets`.
+    """
+    paths = [asset.file for asset in assets]
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    if max_workers <= 1 or sum(map(os.path.getsize, paths)) < PARALLEL_READ_MIN_BYTES:
+        yield from map(read_data, paths)
+        return
 
-                translate_tokenizer_formula(
-                    tok,
-                    replace_range,
-                    column_shift,
-                    header_action,
-                    insertion_break_column,
-                )
-                cell.value = tok.render()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(read_data, paths)
 
 
 def main(
@@ -300,6 +795,9 @@ def main(
     output_properties: AssetProperties = {},
 ):
     """Use an Excel file as a template.
+    Large inputs are read in parallel processes (see `read_assets`),
+    so on platforms that spawn processes (e.g. Windows and macOS)
+    scripts calling this function must guard it with `if __name__ == "__main__":`.
 
     Args:
         template_path (str): Aboslute path to the Excel template.
@@ -321,6 +819,8 @@ def main(
         raise ValueError("Empty data selector")
 
     db = syre.Database()
+    # NB: The template is saved as the output, so external links must be kept.
+    # Rich text and VBA are already skipped by default.
     template = xl.load_workbook(filename=template_path)
     ws = utils.get_worksheet(template, worksheet)
 
@@ -331,43 +831,49 @@ def main(
     if len(assets) == 0:
         raise RuntimeError("No matching assets")
 
+    # NB: Reserve the columns for all assets at once,
+    # as each insertion shifts every cell to its right.
+    ws.insert_cols(
+        utils.index_to_excel(replace_range[0]), len(assets) * len(column_selection)
+    )
+
     if header_action is HeaderAction.INSERT:
         ws.insert_rows(0)
 
-    db_root_path = utils.canonicalize_db_root_path(db)
-    current_col = replace_range[0]
     if data_format_type is DataFormatType.EXCEL_WORKBOOK:
-        for asset in assets:
-            asset_path = os.path.relpath(asset.file, db_root_path)
-            insert_data_from_excel(
-                asset,
-                ws,
-                data_format_args.sheet,
-                column_selection,
-                header_action,
-                current_col,
-                skip_rows=data_format_args.skip_rows,
-                asset_path=asset_path,
-            )
-            current_col += 1
-
+        skip_rows = (
+            data_format_args.skip_rows if header_action is HeaderAction.REPLACE else 0
+        )
+        read_data = partial(
+            read_excel_data,
+            data_worksheet=data_format_args.sheet,
+            column_selection=column_selection,
+            skip_rows=skip_rows,
+        )
     elif data_format_type is DataFormatType.SPREADSHEET:
-        for asset in assets:
-            asset_path = os.path.relpath(asset.file, db_root_path)
-            insert_data_from_csv(
-                asset,
-                ws,
-                column_selection,
-                header_action,
-                current_col,
-                skip_rows=data_format_args.skip_rows,
-                comment=data_format_args.comment,
-                asset_path=asset_path,
-            )
-            current_col += 1
+        read_data = partial(
+            read_csv_data,
+            columns_selection=column_selection,
+            skip_rows=data_format_args.skip_rows,
+            comment=data_format_args.comment,
+        )
     else:
         raise ValueError("Invalid data format type")
 
+    db_root_path = utils.canonicalize_db_root_path(db)
+    # NB: Asset files are usually within the database root,
+    # so their relative path can be sliced out instead of resolved by `relpath`.
+    db_root_prefix = os.path.join(db_root_path, "")
+    current_col = replace_range[0]
+    for asset, data in zip(assets, read_assets(read_data, assets)):
+        if asset.file.startswith(db_root_prefix):
+            asset_path = asset.file[len(db_root_prefix) :]
+        else:
+            asset_path = os.path.relpath(asset.file, db_root_path)
+
+        insert_data(ws, data, header_action, current_col, asset_path=asset_path)
+        current_col += len(column_selection)
+
     translate_worksheet_formulas(
         template,
         replace_range,
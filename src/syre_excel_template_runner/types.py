@@ -80,6 +80,21 @@ class ExcelDataArgs:
     skip_rows: int = 0
 
 
+@dataclass
+class DataColumn:
+    """Data read from a column of an input asset.
+
+    Args:
+        values (list): Values of the column.
+        header (tuple, optional): Header labels of the column, from top to bottom. Defaults to ().
+        numeric (bool, optional): Whether all values are known to be `int`, `float`, or `None`. Defaults to False.
+    """
+
+    values: list
+    header: tuple = ()
+    numeric: bool = False
+
+
 Worksheet = openpyxl.worksheet.worksheet.Worksheet
 DataFormatArgs = Union[SpreadsheetDataArgs, ExcelDataArgs]
 
@@ -93,6 +108,7 @@ if _LEGACY_:
     AssetProperties = Dict[str, Any]
     DataSelectionArgs = List[str]
     ReplaceRange = Tuple[int, int]
+    AssetData = List[DataColumn]
 
 else:
     Metadata = dict[str, Any]
@@ -102,3 +118,4 @@ else:
     AssetProperties = dict[str, Any]
     DataSelectionArgs = list[str]
     ReplaceRange = tuple[int, int]
+    AssetData = list[DataColumn]
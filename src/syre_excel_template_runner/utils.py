@@ -1,6 +1,9 @@
 import os
+from functools import lru_cache
+from typing import Iterable
 import openpyxl as xl
 import openpyxl.utils as xl_utils
+from openpyxl.cell.cell import Cell
 from .types import (
     WorksheetId,
     Worksheet,
@@ -18,6 +21,21 @@ import syre
 
 UNC_PATH = "\\\\?\\"
 
+# NB: Writing cells directly relies on the private cell store of `openpyxl` worksheets.
+# Disable to write cells through `Worksheet.cell` instead.
+DIRECT_CELL_WRITES = True
+
+_DATA_FORMAT_TYPE_ARGS = {
+    "spreadsheet": DataFormatType.SPREADSHEET,
+    "excel": DataFormatType.EXCEL_WORKBOOK,
+}
+
+_HEADER_ACTION_ARGS = {
+    "none": HeaderAction.NONE,
+    "insert": HeaderAction.INSERT,
+    "replace": HeaderAction.REPLACE,
+}
+
 
 def parse_data_format_type_arg(arg: str) -> DataFormatType:
     """Parses a string in to a data format type.
@@ -31,13 +49,10 @@ def parse_data_format_type_arg(arg: str) -> DataFormatType:
     Returns:
         DataFormatType: Corresponding data format type.
     """
-    arg = arg.lower()
-    if arg == "spreadsheet":
-        return DataFormatType.SPREADSHEET
-    elif arg == "excel":
-        return DataFormatType.EXCEL_WORKBOOK
-
-    raise ValueError("Invalid data format type string")
+    try:
+        return _DATA_FORMAT_TYPE_ARGS[arg.lower()]
+    except KeyError:
+        raise ValueError("Invalid data format type string") from None
 
 
 def parse_header_action(arg: str) -> HeaderAction:
@@ -52,15 +67,10 @@ def parse_header_action(arg: str) -> HeaderAction:
     Returns:
         HeaderAction: Corresponsing header action.
     """
-    arg = arg.lower()
-    if arg == "none":
-        return HeaderAction.NONE
-    elif arg == "insert":
-        return HeaderAction.INSERT
-    elif arg == "replace":
-        return HeaderAction.REPLACE
-
-    raise ValueError("Invalid header action string")
+    try:
+        return _HEADER_ACTION_ARGS[arg.lower()]
+    except KeyError:
+        raise ValueError("Invalid header action string") from None
 
 
 def parse_metadata_args(args: MetadataArgs) -> Metadata:
@@ -98,13 +108,17 @@ def parse_column_selection_args(args: DataSelectionArgs) -> ColumnSelection:
     Returns:
         ColumnSelection: Column selection.
     """
-    try:
-        return [int(arg) for arg in args]
-    except ValueError:
-        pass
+    if len(args) == 0:
+        return []
 
+    # NB: Dispatch on the first argument to avoid raising exceptions for header selections.
+    # Mixed or malformed arguments fall back to being parsed as headers.
+    first = args[0].strip().lstrip("+-")
     try:
-        return list(map(xl_utils.column_index_from_string, args))
+        if first.isdigit():
+            return [int(arg) for arg in args]
+        elif first.isalpha():
+            return list(map(xl_utils.column_index_from_string, args))
     except ValueError:
         pass
 
@@ -173,6 +187,34 @@ def column_shift(replace_range_end: int, insertion_break_column: int) -> int:
     return insertion_break_column - replace_range_end - 1
 
 
+def _header_selection_type(rep: list) -> ColumnId:
+    """Determines the type of a selector whose elements are lists.
+
+    Args:
+        rep (list): First element of the selector.
+
+    Raises:
+        ValueError: If the selector is invalid.
+
+    Returns:
+        ColumnId:
+    """
+    if len(rep) == 0:
+        raise ValueError("Empty selector")
+
+    if type(rep[0]) is str:
+        return ColumnId.HEADER
+    else:
+        raise ValueError("Invalid selector")
+
+
+# NB: Keyed on the exact type of the selector's first element.
+_SELECTION_TYPES = {
+    int: lambda rep: ColumnId.INDEX,
+    list: _header_selection_type,
+}
+
+
 def selection_type(selector: ColumnSelection) -> ColumnId:
     """Determines the type of selector.
 
@@ -192,18 +234,12 @@ def selection_type(selector: ColumnSelection) -> ColumnId:
         raise ValueError("Empty selector")
 
     rep = selector[0]
-    if type(rep) is int:
-        return ColumnId.INDEX
-    elif type(rep) is list:
-        if len(rep) == 0:
-            raise ValueError("Empty selector")
-
-        if type(rep[0]) is str:
-            return ColumnId.HEADER
-        else:
-            raise ValueError("Invalid selector")
-    else:
-        raise ValueError("Invalid selector")
+    try:
+        classify = _SELECTION_TYPES[type(rep)]
+    except KeyError:
+        raise ValueError("Invalid selector") from None
+
+    return classify(rep)
 
 
 def get_worksheet(workbook: xl.Workbook, sheet: WorksheetId) -> Worksheet:
@@ -219,7 +255,7 @@ def get_worksheet(workbook: xl.Workbook, sheet: WorksheetId) -> Worksheet:
     Returns:
         xl.worksheet.worksheet.Worksheet:
     """
-    if type(sheet) is int and sheet < (workbook.sheets):
+    if type(sheet) is int and sheet < len(workbook.worksheets):
         return workbook.worksheets[sheet]
     elif type(sheet) is str and sheet in workbook:
         return workbook[sheet]
@@ -227,19 +263,89 @@ def get_worksheet(workbook: xl.Workbook, sheet: WorksheetId) -> Worksheet:
         raise ValueError("Invalid input worksheet")
 
 
-def canonicalize_db_root_path(db: syre.Database) -> str:
-    """Canonicalizes teh database's root path.
+def write_column(
+    worksheet: Worksheet,
+    column: int,
+    start_row: int,
+    values: Iterable,
+    numeric: bool = False,
+) -> int:
+    """Writes values into consecutive rows of a worksheet column.
+    If `DIRECT_CELL_WRITES` is set, cells are inserted directly into the worksheet,
+    bypassing the overhead of `Worksheet.cell` for each value.
+    `None` values are skipped.
 
     Args:
-        db (syre.Database): Database
+        worksheet (Worksheet): Worksheet to write the values into.
+        column (int): Excel index (1-based) of the column.
+        start_row (int): Excel index (1-based) of the first row.
+        values (Iterable): Values to write.
+        numeric (bool, optional): All values are known to be `int`, `float`, or `None`,
+            so type conversion of the values is skipped.
+            Only used for direct cell writes. Defaults to False.
 
     Returns:
-        str: Canonicalized root path of the database.
+        int: Excel index (1-based) of the row after the last value.
     """
-    root_path = os.path.realpath(db._root_path)
+    row = start_row
+    if not DIRECT_CELL_WRITES:
+        for value in values:
+            if value is not None:
+                worksheet.cell(row=row, column=column, value=value)
+
+            row += 1
+
+        return row
+
+    cells = worksheet._cells
+    if numeric:
+        for value in values:
+            if value is not None:
+                cell = Cell(worksheet, row=row, column=column)
+                cell._value = value
+                cells[(row, column)] = cell
+
+            row += 1
+    else:
+        for value in values:
+            if value is not None:
+                cells[(row, column)] = Cell(
+                    worksheet, row=row, column=column, value=value
+                )
+
+            row += 1
+
+    # NB: `_current_row` is maintained by `Worksheet.cell` and used by `Worksheet.append`.
+    worksheet._current_row = max(worksheet._current_row, row - 1)
+    return row
+
+
+@lru_cache(maxsize=None)
+def _canonicalize_root_path(root_path: str) -> str:
+    """Memoized canonicalization of a root path.
+
+    Args:
+        root_path (str): Path to canonicalize.
+
+    Returns:
+        str: Canonicalized path.
+    """
+    root_path = os.path.realpath(root_path)
     if os.name == "nt":
         # windows, ensure UNC
         if not root_path.startswith(UNC_PATH):
-            root_path = UNC_PATH + path
+            root_path = UNC_PATH + root_path
 
     return root_path
+
+
+def canonicalize_db_root_path(db: syre.Database) -> str:
+    """Canonicalizes teh database's root path.
+
+    Args:
+        db (syre.Database): Database
+
+    Returns:
+        str: Canonicalized root path of the database.
+    """
+    return _canonicalize_root_path(db._root_path)
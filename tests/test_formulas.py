@@ -0,0 +1,80 @@
+import pytest
+from openpyxl.formula.tokenizer import Tokenizer
+
+from syre_excel_template_runner import excel_template_runner, utils
+from syre_excel_template_runner.types import HeaderAction
+
+REPLACE_RANGE = (2, 3)
+INSERTION_BREAK_COLUMN = 6
+MIN_COLUMN = utils.index_to_excel(REPLACE_RANGE[0])
+
+# NB: Sheet qualified references are not supported by `translate_tokenizer_formula`,
+# so are only covered by the reference tests.
+FORMULAS = [
+    "=A1+B2",
+    "=$A$1+B$2",
+    "=$C$1",
+    "=A$1:$D2",
+    "=SUM(A:B)",
+    "=SUM(A:C)",
+    "=SUM($B:$E)",
+    "=A1:D1",
+    "=SUM(C1:D1)",
+    "=E5*2",
+    "=SUM(E:F)",
+    "=a1*2",
+    "=d1*2",
+    "=c1*2",
+    "=SUM(A1)",
+    "=LOG10(A2)",
+    "=LOG10(C2)",
+    "=ATAN2(A1, D1)",
+    '="A1"&B1',
+    "=1E5+A1",
+    "=TRUE",
+]
+
+
+def translate(formula, header_action):
+    tok = Tokenizer(formula)
+    excel_template_runner.translate_tokenizer_formula(
+        tok,
+        REPLACE_RANGE,
+        utils.column_shift(REPLACE_RANGE[1], INSERTION_BREAK_COLUMN),
+        header_action,
+        INSERTION_BREAK_COLUMN,
+    )
+    return tok.render()
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "=$C$1",
+        "=A$1:$D2",
+        "=SUM(A:C)",
+        "=SUM($B:$E)",
+        "=Sheet2!D5",
+        "='My Sheet'!E1",
+        "=c1*2",
+        "=LOG10(C2)",
+        "=ATAN2(A1, D1)",
+    ],
+)
+def test_references_affected_column(formula):
+    assert excel_template_runner._references_column_from(formula, MIN_COLUMN)
+
+
+@pytest.mark.parametrize(
+    "formula",
+    ["=A1+B2", "=$A$1+B$2", "=SUM(A:B)", "=Sheet2!B5", "=a1*2", "=SUM(A1)", "=TRUE"],
+)
+def test_does_not_reference_affected_column(formula):
+    assert not excel_template_runner._references_column_from(formula, MIN_COLUMN)
+
+
+@pytest.mark.parametrize("header_action", list(HeaderAction))
+@pytest.mark.parametrize("formula", FORMULAS)
+def test_translated_formulas_are_not_skipped(formula, header_action):
+    if translate(formula, header_action) != formula:
+        assert excel_template_runner._references_column_from(formula, MIN_COLUMN)
@@ -0,0 +1,18 @@
+from types import SimpleNamespace
+
+from syre_excel_template_runner import excel_template_runner
+
+
+def test_small_assets_are_read_serially(monkeypatch, tmp_path):
+    def no_executor(*args, **kwargs):
+        raise AssertionError("small assets should not be read in parallel")
+
+    monkeypatch.setattr(excel_template_runner, "ProcessPoolExecutor", no_executor)
+    assets = []
+    for idx in range(3):
+        path = tmp_path / f"data_{idx}.csv"
+        path.write_text(f"a\n{idx}\n")
+        assets.append(SimpleNamespace(file=str(path)))
+
+    data = list(excel_template_runner.read_assets(lambda path: path, assets))
+    assert data == [asset.file for asset in assets]
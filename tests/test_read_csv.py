@@ -0,0 +1,92 @@
+import math
+
+import pytest
+
+from syre_excel_template_runner import excel_template_runner
+
+
+def comparable(data):
+    """Makes column data comparable, including value types and missing values."""
+    return [
+        (
+            column.header,
+            column.numeric,
+            [
+                (
+                    "nan"
+                    if isinstance(value, float) and math.isnan(value)
+                    else (type(value), value)
+                )
+                for value in column.values
+            ],
+        )
+        for column in data
+    ]
+
+
+def read_with_both_readers(monkeypatch, path, selection, **kwargs):
+    """Reads a CSV file with `pyarrow` and `pandas`."""
+    pytest.importorskip("pyarrow")
+    arrow_data = excel_template_runner.read_csv_data(path, selection, **kwargs)
+    monkeypatch.setattr(excel_template_runner, "pa_csv", None)
+    pandas_data = excel_template_runner.read_csv_data(path, selection, **kwargs)
+    return arrow_data, pandas_data
+
+
+@pytest.mark.parametrize(
+    "contents, selection",
+    [
+        pytest.param("a,a,,d\n1,2,3,4\n5,6,7,8\n", [1], id="duplicate-header"),
+        pytest.param("a,a,,d\n1,2,3,4\n5,6,7,8\n", [3, 2, 0], id="unnamed-header"),
+        pytest.param(
+            "a,b\n2024-01-01T00:00:00Z,1\n2024-01-02T00:00:00Z,2\n",
+            [0, 1],
+            id="timestamp",
+        ),
+        pytest.param("a,b\n2024-01-01,1\n2024-01-02,2\n", [0, 1], id="date"),
+        pytest.param("a,b\nx,1\nNA,2\nn/a,3\n,4\n", [0], id="missing-text"),
+        pytest.param("a,b\nTrue,1\nfalse,2\n", [0, 1], id="boolean"),
+        pytest.param("a,b\nTrue,1\n,2\n", [0], id="boolean-missing"),
+        pytest.param("a,b\n1,1.5\n,\n3,2.5\n", [0, 1], id="numeric-missing"),
+        pytest.param(
+            "a\n" + "".join(f"{idx}\n" for idx in range(200_000)) + "x\n",
+            [0],
+            id="numeric-then-text",
+        ),
+    ],
+)
+def test_pyarrow_matches_pandas(monkeypatch, tmp_path, contents, selection):
+    path = tmp_path / "data.csv"
+    path.write_text(contents)
+    arrow_data, pandas_data = read_with_both_readers(monkeypatch, str(path), selection)
+    assert comparable(arrow_data) == comparable(pandas_data)
+
+
+def test_duplicate_header_selected_by_position(monkeypatch, tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,a,,d\n1,2,3,4\n5,6,7,8\n")
+    arrow_data, _ = read_with_both_readers(monkeypatch, str(path), [1])
+    assert arrow_data[0].header == ("a.1",)
+    assert arrow_data[0].values == [2, 6]
+
+
+@pytest.mark.parametrize("comment", [None, "#"])
+def test_negative_index(monkeypatch, tmp_path, comment):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b,c\n1,2,3\n4,5,6\n")
+    arrow_data, pandas_data = read_with_both_readers(
+        monkeypatch, str(path), [-1, 0], comment=comment
+    )
+    assert comparable(arrow_data) == comparable(pandas_data)
+    assert arrow_data[0].header == ("c",)
+    assert arrow_data[0].values == [3, 6]
+
+
+def test_skip_rows(monkeypatch, tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("notes\n\na,b\n1,2\n3,4\n")
+    arrow_data, pandas_data = read_with_both_readers(
+        monkeypatch, str(path), [1], skip_rows=1
+    )
+    assert comparable(arrow_data) == comparable(pandas_data)
+    assert arrow_data[0].values == [2, 4]
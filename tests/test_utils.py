@@ -0,0 +1,35 @@
+import datetime
+
+import openpyxl as xl
+import pytest
+
+from syre_excel_template_runner import utils
+
+
+def written_cells(worksheet):
+    return {
+        coordinate: (cell.value, cell.data_type)
+        for coordinate, cell in worksheet._cells.items()
+    }
+
+
+@pytest.mark.parametrize(
+    "values, numeric",
+    [
+        pytest.param([1, None, 2.5, 3], True, id="numeric"),
+        pytest.param(
+            ["a", None, "=A1+1", datetime.date(2024, 1, 1), 4], False, id="mixed"
+        ),
+    ],
+)
+def test_write_column_matches_worksheet_cell(monkeypatch, values, numeric):
+    direct = xl.Workbook().active
+    direct_end = utils.write_column(direct, 2, 3, values, numeric=numeric)
+
+    monkeypatch.setattr(utils, "DIRECT_CELL_WRITES", False)
+    public = xl.Workbook().active
+    public_end = utils.write_column(public, 2, 3, values, numeric=numeric)
+
+    assert direct_end == public_end == 3 + len(values)
+    assert written_cells(direct) == written_cells(public)
+    assert direct.max_row == public.max_row